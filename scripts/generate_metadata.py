@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Regenerate src/_openreview_meta.json from an installed openreview-py.
+
+The MCP server ships a static metadata snapshot so it has no runtime
+dependency on openreview-py. This script rebuilds that snapshot in a dev
+environment where openreview-py is installed: it resolves every tracked
+class, refreshes each method signature via inspect.signature, and reports
+methods that have drifted (removed upstream, or new public methods that the
+snapshot does not document yet).
+
+Curated docstrings in the snapshot are kept as-is — much of the shipped
+text is hand-written guidance (API version notes, workflow tips) that
+introspection cannot produce. Only the machine-derivable parts are
+refreshed.
+
+Usage:
+    python scripts/generate_metadata.py          # rewrite the snapshot in place
+    python scripts/generate_metadata.py --check  # exit 1 if the snapshot is stale
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import sys
+from pathlib import Path
+
+META_PATH = Path(__file__).resolve().parent.parent / "src" / "_openreview_meta.json"
+
+
+def format_signature(name, func):
+    """Render a method signature the way the snapshot stores it, or None."""
+    try:
+        sig = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+    params = ", ".join(
+        str(param) for param in sig.parameters.values() if param.name != "self"
+    )
+    return f"{name}({params})"
+
+
+def resolve_class(module_path, class_name):
+    """Import module_path and return the named class, or None if unavailable."""
+    try:
+        module = importlib.import_module(module_path)
+    except ImportError:
+        return None
+    return getattr(module, class_name, None)
+
+
+def regenerate_class(entry):
+    """Return an updated copy of one class entry plus a list of warnings."""
+    warnings = []
+    cls = resolve_class(entry["module"], entry["name"])
+    if cls is None:
+        warnings.append(
+            f"{entry['module']}.{entry['name']}: not importable, entry left unchanged"
+        )
+        return entry, warnings
+
+    tracked_names = {method["name"] for method in entry["methods"]}
+    methods = []
+    for method in entry["methods"]:
+        updated = dict(method)
+        func = getattr(cls, method["name"], None)
+        if func is None:
+            warnings.append(
+                f"{entry['name']}.{method['name']}: missing upstream, entry kept"
+            )
+        else:
+            signature = format_signature(method["name"], func)
+            if signature and signature != method["signature"]:
+                warnings.append(f"{entry['name']}.{method['name']}: signature updated")
+                updated["signature"] = signature
+        methods.append(updated)
+
+    # Surface new public methods so they can be documented in the snapshot
+    for name, member in inspect.getmembers(cls, callable):
+        if not name.startswith("_") and name not in tracked_names:
+            warnings.append(f"{entry['name']}.{name}: new upstream method, not tracked")
+
+    updated_entry = dict(entry)
+    updated_entry["methods"] = methods
+    return updated_entry, warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if the regenerated metadata differs from the snapshot",
+    )
+    args = parser.parse_args()
+
+    current = json.loads(META_PATH.read_text(encoding="utf-8"))
+
+    classes = []
+    for entry in current["classes"]:
+        updated, warnings = regenerate_class(entry)
+        classes.append(updated)
+        for warning in warnings:
+            print(f"warning: {warning}", file=sys.stderr)
+
+    # Carry over non-class sections (e.g. "tools") untouched
+    regenerated = dict(current)
+    regenerated["classes"] = classes
+    rendered = json.dumps(regenerated, indent=2, ensure_ascii=False) + "\n"
+
+    if args.check:
+        if rendered != META_PATH.read_text(encoding="utf-8"):
+            print("metadata snapshot is stale; run scripts/generate_metadata.py", file=sys.stderr)
+            return 1
+        print("metadata snapshot is up to date")
+        return 0
+
+    META_PATH.write_text(rendered, encoding="utf-8")
+    print(f"wrote {META_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,8 +11,11 @@ from fastmcp.utilities.logging import get_logger
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware, RetryMiddleware
 
 from src.introspect import (
+    get_openreview_class,
     get_openreview_classes,
+    get_openreview_function,
     get_openreview_functions,
+    parse_signature,
     search_openreview_functions,
     get_openreview_tools,
     get_library_overview
@@ -231,8 +234,12 @@ async def list_openreview_classes(ctx: Context, include_methods: bool = True) ->
         # - Include/exclude private methods
         # - Add property information
         if not include_methods:
-            for cls in classes:
-                cls.pop("methods", None)
+            # The introspection results are cached and shared, so build
+            # filtered copies instead of mutating the shared structures
+            classes = [
+                {k: v for k, v in cls.items() if k != "methods"}
+                for cls in classes
+            ]
 
         # Log the results
         method_count = sum(len(cls.get("methods", [])) for cls in classes if include_methods)
@@ -487,38 +494,36 @@ async def get_function_details(function_name: str, ctx: Context) -> Dict[str, An
             await ctx.warning(error_msg)
             return {"error": error_msg}
 
-        functions = get_openreview_functions()
+        # Find the function via the cached name index
+        func = get_openreview_function(function_name)
+        if func is not None:
+            # TODO: Add more detailed information:
+            # - Parameter types and descriptions
+            # - Return type information
+            # - Usage examples
+            # - Related functions
+            # - Error conditions
+            result = {
+                **func,
+                "parameters": parse_signature(func.get("signature", "")),
+                "return_type": func.get("return_type", "unknown"),
+                "examples": [],  # TODO: Add usage examples
+                "related_functions": []  # TODO: Find related functions
+            }
+
+            # Log successful retrieval
+            logger.info(f"Found function details for '{function_name}'")
 
-        # Find the function by name
-        for func in functions:
-            if func["name"] == function_name:
-                # TODO: Add more detailed information:
-                # - Parameter types and descriptions
-                # - Return type information
-                # - Usage examples
-                # - Related functions
-                # - Error conditions
-                result = {
-                    **func,
-                    "parameters": [],  # TODO: Extract parameter info
-                    "return_type": func.get("return_type", "unknown"),
-                    "examples": [],  # TODO: Add usage examples
-                    "related_functions": []  # TODO: Find related functions
-                }
-
-                # Log successful retrieval
-                logger.info(f"Found function details for '{function_name}'")
-
-                module = func.get("module", "unknown")
-                signature = func.get("signature", "unknown")
-                await ctx.info(f"Retrieved details for function '{function_name}'",
-                              extra={
-                                  "function_name": function_name,
-                                  "module": module,
-                                  "signature": signature
-                              })
-
-                return result
+            module = func.get("module", "unknown")
+            signature = func.get("signature", "unknown")
+            await ctx.info(f"Retrieved details for function '{function_name}'",
+                          extra={
+                              "function_name": function_name,
+                              "module": module,
+                              "signature": signature
+                          })
+
+            return result
 
         # Function not found
         error_msg = f"Function '{function_name}' not found"
@@ -663,8 +668,7 @@ async def get_venue_class_details(ctx: Context) -> Dict[str, Any]:
     await ctx.info("Providing comprehensive Venue class documentation for conference management")
 
     try:
-        classes = get_openreview_classes()
-        venue_class = next((c for c in classes if c["name"] == "Venue"), None)
+        venue_class = get_openreview_class("Venue")
 
         if not venue_class:
             error_msg = "Venue class not found in class definitions"
@@ -785,8 +789,7 @@ async def get_group_builder_details(ctx: Context) -> Dict[str, Any]:
     await ctx.info("Providing comprehensive GroupBuilder class documentation for venue group management")
 
     try:
-        classes = get_openreview_classes()
-        group_builder_class = next((c for c in classes if c["name"] == "GroupBuilder"), None)
+        group_builder_class = get_openreview_class("GroupBuilder")
 
         if not group_builder_class:
             error_msg = "GroupBuilder class not found in class definitions"